@@ -7,23 +7,163 @@ Usage:
     python lottery.py               # Show current standings and add new draw
 """
 
+import atexit
 import csv
+import functools
+import itertools
 import re
-import pdfplumber
 import argparse
 import os
-import pandas as pd
-from termcolor import colored
+import numpy as np
 import sys
 import json
 from pathlib import Path
-from collections import defaultdict
-from datetime import datetime
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+GREEN = '\033[32m'
+GREEN_BOLD = '\033[1;32m'
+RESET = '\033[0m'
+
+# Highest lottery number that can be drawn; the int8 number arrays, the
+# bitmasks and the display tables all assume numbers stay in 1-MAX_NUMBER.
+MAX_NUMBER = 45
+
+# Pre-rendered display strings for every possible lottery number, so the
+# hot display loop is a table lookup instead of a format call.
+PLAIN_NUMBERS = [f'{n:2d}' for n in range(MAX_NUMBER + 1)]
+GREEN_NUMBERS = [f'{GREEN}{n:2d}{RESET}' for n in range(MAX_NUMBER + 1)]
+GREEN_BOLD_NUMBERS = [f'{GREEN_BOLD}{n:2d}{RESET}' for n in range(MAX_NUMBER + 1)]
+
+# Progress schema: version 2 stores each player's correct numbers as a
+# single integer bitmask instead of a sorted list.
+PROGRESS_VERSION = 2
+
+# Patterns for pulling participant lines out of the lottery PDF, compiled
+# once instead of per line.
+LINE_RE = re.compile(r'^\d{1,3}\s+(.+?)\s+(\d+(?:\s+\d+){9,})')
+# Header/footer lines to skip; the mojibake variant covers badly-decoded
+# euro signs.
+SKIP_RE = re.compile(r'DEELNEMER|TREKKING|BEDRAG|POT|€|â‚¬|INLEG')
+NUM_RE = re.compile(r'\d+')
+TRAIL_NUM_RE = re.compile(r'\s+\d+\s*$')
+XGOED_RE = re.compile(r'\s+X_GOED\s*$')
+
+# Page extraction is CPU-bound; below this page count the process-spawn
+# overhead outweighs the parallel win.
+PARALLEL_PDF_PAGES = 4
+
+
+@functools.lru_cache(maxsize=1)
+def _pdf_backends():
+    """Import a PDF backend on first use, so standings-only runs skip the cost
+
+    pypdfium2 (C-backed) extracts page text much faster than pdfplumber's
+    pure-Python layout engine; we only need extract_text, so prefer it.
+    """
+    try:
+        import pypdfium2 as pdfium
+        return pdfium, None
+    except ImportError:
+        import pdfplumber
+        return None, pdfplumber
 
 
-def colored_intense(text, color):
-    """Create an intense colored version of the text"""
-    return f"\033[1m{colored(text, color)}\033[0m"
+def _pdf_page_count(pdf_path):
+    """Number of pages in a PDF, via the fastest available backend"""
+    pdfium, pdfplumber = _pdf_backends()
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+def _extract_page_text(pdf_path, page_index):
+    """Extract the text of a single PDF page (top-level for multiprocessing)"""
+    pdfium, pdfplumber = _pdf_backends()
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            return pdf[page_index].get_textpage().get_text_range()
+        finally:
+            pdf.close()
+    with pdfplumber.open(pdf_path) as pdf:
+        return pdf.pages[page_index].extract_text()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_participants_cached(path, mtime_ns):
+    """Parse the participants CSV once per (path, mtime) pair
+
+    Returns the names as an object array, the chosen numbers as an
+    (N, 10) int8 array with each row pre-sorted, and the per-player
+    uint64 bitmasks, so hot loops work on contiguous precomputed arrays.
+    """
+    names = []
+    rows = []
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader, None)  # header
+        for row in reader:
+            names.append(row[0])
+            rows.append([int(n) for n in row[1:11]])
+    numbers = np.array(rows, dtype=np.int8).reshape(-1, 10)
+    numbers.sort(axis=1)
+    return np.array(names, dtype=object), numbers, player_bitmasks(numbers)
+
+
+def load_participants(path):
+    """Load participant (names, numbers, masks) arrays, reused until the file changes"""
+    return _load_participants_cached(path, os.stat(path).st_mtime_ns)
+
+
+def number_mask(numbers):
+    """Pack lottery numbers (1-45) into a single integer bitmask"""
+    mask = 0
+    for n in numbers:
+        mask |= 1 << int(n)
+    return mask
+
+
+def mask_to_numbers(mask):
+    """Expand a bitmask back into a sorted list of numbers"""
+    numbers = []
+    while mask:
+        low = mask & -mask
+        numbers.append(low.bit_length() - 1)
+        mask ^= low
+    return numbers
+
+
+def player_correct_mask(player):
+    """Correct-numbers bitmask for a player record (v2 mask or legacy list)"""
+    if 'mask' in player:
+        return player['mask']
+    return number_mask(player.get('correct_numbers', []))
+
+
+def player_bitmasks(all_numbers):
+    """Compute a uint64 bitmask per row of an (N, 10) numbers array"""
+    return np.bitwise_or.reduce(np.uint64(1) << all_numbers.astype(np.uint64), axis=1)
+
+
+def load_json(path):
+    """Parse a JSON file, preferring orjson when it is installed"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class LotteryManager:
@@ -32,72 +172,102 @@ class LotteryManager:
         self.participants_file = 'data/lottery_participants.csv'
         self.trekking_file = 'data/trekking.csv'
         self.progress = {
+            'version': PROGRESS_VERSION,
             'players': {},
             'processed_draws': []
         }
+        self._dirty = False
+        self._processed_set = set()
+        self._filter_family = self._read_filter_family()
         self.load_progress()
         
     def load_progress(self):
         """Load existing progress data"""
         if os.path.exists(self.progress_file):
             try:
-                with open(self.progress_file, 'r') as f:
-                    saved_progress = json.load(f)
-                    self.progress['players'].update(saved_progress.get('players', {}))
-                    self.progress['processed_draws'] = saved_progress.get('processed_draws', [])
-            except (json.JSONDecodeError, IOError) as e:
+                saved_progress = load_json(self.progress_file)
+                for name, player in saved_progress.get('players', {}).items():
+                    if 'mask' not in player:
+                        # Legacy format: convert the correct-numbers list
+                        mask = number_mask(player.get('correct_numbers', []))
+                        player = {'total_correct': mask.bit_count(), 'mask': mask}
+                    self.progress['players'][name] = player
+                self.progress['processed_draws'] = saved_progress.get('processed_draws', [])
+                self._processed_set = set(self.progress['processed_draws'])
+            except (ValueError, IOError) as e:
                 print(f"Error loading progress file: {e}")
                 print("Starting with fresh progress file")
         else:
             print("No existing progress file found. Starting fresh.")
             
     def save_progress(self):
-        """Save progress data"""
+        """Save progress data atomically"""
         os.makedirs('data', exist_ok=True)
+        if orjson is not None:
+            data = orjson.dumps(self.progress)
+        else:
+            data = json.dumps(self.progress).encode('utf-8')
+        tmp_file = self.progress_file + '.tmp'
         try:
-            with open(self.progress_file, 'w') as f:
-                json.dump(self.progress, f, indent=2)
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.progress_file)
+            self._dirty = False
         except IOError as e:
             print(f"Error saving progress file: {e}")
 
+    def flush(self):
+        """Write progress to disk if it changed since the last save"""
+        if self._dirty:
+            self.save_progress()
+
+    def _extract_pages(self, pdf_path):
+        """Extract text for every page, in parallel for larger PDFs"""
+        page_count = _pdf_page_count(pdf_path)
+        if page_count < PARALLEL_PDF_PAGES:
+            return [_extract_page_text(pdf_path, i) for i in range(page_count)]
+
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(
+                functools.partial(_extract_page_text, pdf_path), range(page_count)))
+
     def parse_pdf_lottery_data(self, pdf_path):
         """Parse participant data from PDF file"""
         participants = []
-        last_name = None
+        last_name_parts = []
         name_count = defaultdict(int)
 
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                lines = text.split('\n')
-
-                for line in lines:
-                    if not line.strip() or line.startswith('DEELNEMER') or 'TREKKING' in line or \
-                            'BEDRAG' in line or 'POT' in line or '€' in line or \
-                            'DEELNEMERS:' in line or 'INLEG' in line:
-                        continue
-
-                    match = re.match(r'^\d{1,3}\s+(.+?)\s+(\d+(?:\s+\d+){9,})', line)
-
-                    if match:
-                        name = match.group(1)
-                        numbers = re.findall(r'\d+', match.group(2))[:10]
-
-                        name = re.sub(r'\s+\d+\s*$', '', name)
-                        name = re.sub(r'\s+X_GOED\s*$', '', name)
-
-                        if len(numbers) == 10:
-                            name_count[name] += 1
-                            unique_name = f"{name} ({name_count[name]})" if name_count[name] > 1 else name
-                            participants.append({
-                                'name': unique_name.strip(),
-                                'numbers': [int(num) for num in numbers]
-                            })
-                            last_name = name.strip()
-                    else:
-                        if last_name:
-                            last_name += ' ' + line.strip()
-                            participants[-1]['name'] = last_name
+        for text in self._extract_pages(pdf_path):
+            for line in text.splitlines():
+                line = line.strip()
+                if not line or SKIP_RE.search(line):
+                    continue
+
+                match = LINE_RE.match(line)
+
+                if match:
+                    name = match.group(1)
+                    numbers = [int(num) for num in NUM_RE.findall(match.group(2))[:10]]
+
+                    name = TRAIL_NUM_RE.sub('', name)
+                    name = XGOED_RE.sub('', name)
+
+                    if len(numbers) == 10 and not all(1 <= n <= MAX_NUMBER for n in numbers):
+                        print(f"Warning: skipping {name.strip()}: "
+                              f"numbers outside 1-{MAX_NUMBER}: {numbers}")
+                        last_name_parts = []
+                    elif len(numbers) == 10:
+                        name_count[name] += 1
+                        unique_name = f"{name} ({name_count[name]})" if name_count[name] > 1 else name
+                        participants.append({
+                            'name': unique_name.strip(),
+                            'numbers': numbers
+                        })
+                        last_name_parts = [name.strip()]
+                else:
+                    if last_name_parts:
+                        last_name_parts.append(line)
+                        participants[-1]['name'] = ' '.join(last_name_parts)
 
         return participants
 
@@ -122,7 +292,8 @@ class LotteryManager:
             self.save_participants_to_csv(participants)
             
             # Reset progress for new lottery
-            self.progress = {'players': {}, 'processed_draws': []}
+            self.progress = {'version': PROGRESS_VERSION, 'players': {}, 'processed_draws': []}
+            self._processed_set = set()
             self.save_progress()
             
             # Clear trekking data
@@ -141,16 +312,18 @@ class LotteryManager:
             print(f"Error processing PDF: {str(e)}")
             return False
 
-    def read_trekking(self):
-        """Read trekking.csv, creating it if it doesn't exist"""
-        os.makedirs('data', exist_ok=True)
-        
+    def _last_trekking_row(self):
+        """Return the most recent draw row without parsing the whole history"""
         if not os.path.exists(self.trekking_file):
-            df = pd.DataFrame(columns=['date'] + [f'number{i}' for i in range(1, 7)])
-            df.to_csv(self.trekking_file, index=False)
-            return df
-        
-        return pd.read_csv(self.trekking_file)
+            return None
+        with open(self.trekking_file, newline='') as f:
+            tail = deque(f, maxlen=1)
+        if not tail:
+            return None
+        row = next(csv.reader(tail), None)
+        if not row or row[0] == 'date':
+            return None
+        return row
 
     def parse_input(self):
         """Get lottery numbers from user input"""
@@ -160,83 +333,87 @@ class LotteryManager:
         if not user_input:
             return None
 
-        try:
-            numbers = user_input.replace(',', ' ').split()
-            numbers = [int(n) for n in numbers]
-            if len(numbers) != 6:
-                print("Please enter exactly 6 numbers")
+        numbers = []
+        seen_mask = 0
+        for token in user_input.replace(',', ' ').split():
+            try:
+                n = int(token)
+            except ValueError:
+                print("Please enter valid numbers")
                 return self.parse_input()
-            if not all(1 <= n <= 45 for n in numbers):
+            if not 1 <= n <= 45:
                 print("Numbers must be between 1 and 45")
                 return self.parse_input()
-            if len(set(numbers)) != 6:
+            bit = 1 << n
+            if seen_mask & bit:
                 print("Numbers must be unique")
                 return self.parse_input()
-            return sorted(numbers)
-        except ValueError:
-            print("Please enter valid numbers")
+            seen_mask |= bit
+            numbers.append(n)
+
+        if len(numbers) != 6:
+            print("Please enter exactly 6 numbers")
             return self.parse_input()
+        return sorted(numbers)
 
     def get_draw_date(self):
         """Get draw date from user input"""
-        trekking = self.read_trekking()
-        
-        if trekking.empty:
+        last = self._last_trekking_row()
+
+        if last is None:
             suggested_date = datetime.now().strftime('%d-%b-%y')
         else:
-            last_date = pd.to_datetime(trekking['date'].iloc[-1], format='%d-%b-%y')
-            suggested_date = (last_date + pd.Timedelta(days=7)).strftime('%d-%b-%y')
-        
+            last_date = datetime.strptime(last[0], '%d-%b-%y')
+            suggested_date = (last_date + timedelta(days=7)).strftime('%d-%b-%y')
+
         print(f"\nEnter draw date (suggested: {suggested_date}):")
         date_input = input("Date (DD-MMM-YY): ").strip()
-        
+
         if not date_input:
             return suggested_date
-        
+
         try:
             # Validate date format
-            pd.to_datetime(date_input, format='%d-%b-%y')
+            datetime.strptime(date_input, '%d-%b-%y')
             return date_input
-        except:
+        except ValueError:
             print("Invalid date format. Please use DD-MMM-YY (e.g., 04-Aug-25)")
             return self.get_draw_date()
 
     def add_to_trekking(self, numbers, draw_date):
-        """Add new draw to trekking data"""
-        trekking = self.read_trekking()
-        
-        new_row = {
-            'date': draw_date,
-            'number1': numbers[0],
-            'number2': numbers[1],
-            'number3': numbers[2],
-            'number4': numbers[3],
-            'number5': numbers[4],
-            'number6': numbers[5]
-        }
-        trekking = pd.concat([trekking, pd.DataFrame([new_row])], ignore_index=True)
-        trekking.to_csv(self.trekking_file, index=False)
+        """Append a new draw to the trekking file"""
+        os.makedirs('data', exist_ok=True)
+        needs_header = (not os.path.exists(self.trekking_file)
+                        or os.path.getsize(self.trekking_file) == 0)
+        with open(self.trekking_file, 'a', newline='') as f:
+            writer = csv.writer(f)
+            if needs_header:
+                writer.writerow(['date'] + [f'number{i}' for i in range(1, 7)])
+            writer.writerow([draw_date] + [int(n) for n in numbers])
         return draw_date
 
     def update_progress(self, player_results, draw_date):
-        """Update player progress"""
-        for name, correct_numbers in player_results:
-            if name not in self.progress['players']:
-                self.progress['players'][name] = {
-                    'total_correct': 0,
-                    'correct_numbers': []
-                }
-
-            current_correct = set(self.progress['players'][name]['correct_numbers'])
-            new_correct = set(correct_numbers)
-            all_correct = current_correct.union(new_correct)
-
-            self.progress['players'][name]['correct_numbers'] = sorted(list(all_correct))
-            self.progress['players'][name]['total_correct'] = len(all_correct)
-
-        if draw_date not in self.progress['processed_draws']:
+        """Update player progress from (name, draw bitmask) pairs"""
+        for name, draw_mask in player_results:
+            if not draw_mask:
+                continue
+
+            player = self.progress['players'].setdefault(name, {
+                'total_correct': 0,
+                'mask': 0
+            })
+
+            mask = player['mask'] | draw_mask
+            if mask == player['mask']:
+                continue
+            player['mask'] = mask
+            player['total_correct'] = mask.bit_count()
+            self._dirty = True
+
+        if draw_date not in self._processed_set:
+            self._processed_set.add(draw_date)
             self.progress['processed_draws'].append(draw_date)
-        self.save_progress()
+            self._dirty = True
 
     def check_participants(self, winning_numbers, draw_date, is_latest_draw=False):
         """Check participants against winning numbers"""
@@ -244,87 +421,98 @@ class LotteryManager:
             print("No participants file found. Please start a new lottery run first.")
             return
 
-        participants = pd.read_csv(self.participants_file)
+        out = [f"\nResults for draw date: {draw_date}",
+               "=" * 70,
+               "Winning numbers: " + " ".join(f"{n:2d}" for n in sorted(winning_numbers)),
+               "-" * 70]
 
-        print(f"\nResults for draw date: {draw_date}")
-        print("=" * 70)
-        print("Winning numbers:", " ".join(f"{n:2d}" for n in sorted(winning_numbers)))
-        print("-" * 70)
-
-        results = []
-        player_results = []
-
-        for idx, row in participants.iterrows():
-            name = row['Name']
-            numbers = sorted([row[f'Number{i}'] for i in range(1, 11)])
-
-            previous_correct = set(self.progress['players'].get(name, {}).get('correct_numbers', []))
-            correct_in_draw = set(n for n in numbers if n in winning_numbers)
-            truly_new_correct = correct_in_draw - previous_correct if is_latest_draw else set()
-
-            number_str = "["
-            for n in numbers:
-                if n in truly_new_correct:
-                    number_str += colored_intense(f"{n:2d}", 'green') + " "
-                elif n in previous_correct or n in correct_in_draw:
-                    number_str += colored(f"{n:2d}", 'green') + " "
-                else:
-                    number_str += f"{n:2d} "
-            number_str = number_str.rstrip() + "]"
-
-            total_correct = len(previous_correct.union(correct_in_draw))
-            new_correct = len(truly_new_correct) if is_latest_draw else 0
-
-            results.append((total_correct, new_correct, name, number_str))
-            player_results.append((name, [n for n in numbers if n in winning_numbers]))
-
-        results.sort(reverse=True)
+        filter_family = self.get_filter_family()
 
-        if results:
-            highest_total = results[0][0]
-            highest_scorers = []
-            filter_family = self.get_filter_family()
-            filter_results = []
+        names, all_numbers, masks = load_participants(self.participants_file)
+        win_mask = number_mask(winning_numbers)
 
-            for total_correct, new_correct, name, number_str in results:
-                if total_correct == highest_total:
-                    highest_scorers.append((total_correct, new_correct, name, number_str))
-                if filter_family and name.startswith(filter_family):
-                    filter_results.append((total_correct, new_correct, name, number_str))
+        prev_masks = np.array([
+            player_correct_mask(self.progress['players'].get(name, {}))
+            for name in names
+        ], dtype=np.uint64)
 
-            if highest_scorers:
-                print("\nHighest Scorers:")
-                print("-" * 70)
-                for total_correct, new_correct, name, number_str in highest_scorers:
+        correct_masks = masks & np.uint64(win_mask)
+        seen_masks = prev_masks | correct_masks
+        if is_latest_draw:
+            new_masks = correct_masks & ~prev_masks
+        else:
+            new_masks = np.zeros_like(correct_masks)
+        totals = np.bitwise_count(seen_masks)
+        new_hits = np.bitwise_count(new_masks)
+
+        def result_row(i):
+            seen_mask = int(seen_masks[i])
+            truly_new_mask = int(new_masks[i])
+            parts = [
+                GREEN_BOLD_NUMBERS[n] if truly_new_mask >> n & 1
+                else GREEN_NUMBERS[n] if seen_mask >> n & 1
+                else PLAIN_NUMBERS[n]
+                for n in all_numbers[i].tolist()
+            ]
+            return int(totals[i]), int(new_hits[i]), names[i], "[" + " ".join(parts) + "]"
+
+        order = sorted(range(len(names)),
+                       key=lambda i: (totals[i], new_hits[i], names[i]), reverse=True)
+
+        if order:
+            highest_total = totals[order[0]]
+            highest_idx = list(itertools.takewhile(lambda i: totals[i] == highest_total, order))
+            filter_idx = [i for i in order
+                          if filter_family and names[i].startswith(filter_family)]
+
+            if highest_idx:
+                out.append("\nHighest Scorers:")
+                out.append("-" * 70)
+                for i in highest_idx:
+                    total_correct, new_correct, name, number_str = result_row(i)
                     if new_correct > 0:
-                        print(f"{name:<25} {number_str} - {total_correct} total (+{new_correct} new)")
+                        out.append(f"{name:<25} {number_str} - {total_correct} total (+{new_correct} new)")
                     else:
-                        print(f"{name:<25} {number_str} - {total_correct} total")
+                        out.append(f"{name:<25} {number_str} - {total_correct} total")
                     if total_correct >= 10:
-                        print(f"\n🎉 WINNER! {name} has reached 10 correct numbers! 🎉")
-
-            if filter_results:
-                print(f"\n{filter_family} Family Results:")
-                print("-" * 70)
-                for total_correct, new_correct, name, number_str in filter_results:
+                        out.append(f"\n🎉 WINNER! {name} has reached 10 correct numbers! 🎉")
+
+            if filter_idx:
+                prev_totals = np.bitwise_count(prev_masks)
+                out.append(f"\n{filter_family} Family Results:")
+                out.append("-" * 70)
+                for i in filter_idx:
+                    total_correct, new_correct, name, number_str = result_row(i)
                     if new_correct > 0:
-                        print(f"{name:<25} {number_str} - {total_correct} total (+{new_correct} new)")
+                        out.append(f"{name:<25} {number_str} - {total_correct} total (+{new_correct} new)")
                     else:
-                        print(f"{name:<25} {number_str} - {total_correct} total")
-                    
-                    # Add condensed future winner analysis
-                    missing_info = self.get_missing_numbers_info(name, winning_numbers)
-                    if missing_info:
-                        missing_nums, winner_count = missing_info
-                        print(f"    missing: {missing_nums}, {winner_count} other winners")
-                    
+                        out.append(f"{name:<25} {number_str} - {total_correct} total")
+
+                    # Condensed future winner analysis: who else would reach
+                    # 10 if all of this player's missing numbers were drawn
+                    missing_mask = int(masks[i]) & ~int(prev_masks[i])
+                    would_win = prev_totals + np.bitwise_count(masks & np.uint64(missing_mask)) >= 10
+                    would_win[i] = False
+                    out.append(f"    missing: {mask_to_numbers(missing_mask)}, "
+                               f"{int(np.count_nonzero(would_win))} other winners")
+
                     if total_correct >= 10:
-                        print(f"\n🎉 WINNER! {name} has reached 10 correct numbers! 🎉")
+                        out.append(f"\n🎉 WINNER! {name} has reached 10 correct numbers! 🎉")
 
+        sys.stdout.write('\n'.join(out) + '\n')
+        player_results = list(zip(names, (int(m) for m in correct_masks)))
         self.update_progress(player_results, draw_date)
 
     def get_filter_family(self):
-        """Get family filter from .env file if it exists"""
+        """Get the configured family filter (cached at startup)"""
+        return self._filter_family
+
+    def _read_filter_family(self):
+        """Read FILTER_FAMILY from the environment, falling back to .env"""
+        value = os.environ.get('FILTER_FAMILY')
+        if value:
+            return value.strip().strip('"\'')
+
         env_file = '.env'
         if os.path.exists(env_file):
             try:
@@ -337,90 +525,47 @@ class LotteryManager:
                 print(f"Error reading .env file: {e}")
         return None
 
-    def get_missing_numbers_info(self, player_name, winning_numbers):
-        """Get missing numbers and potential winner count for a player"""
-        if not os.path.exists(self.participants_file) or not os.path.exists(self.progress_file):
-            return None
-
-        try:
-            participants_df = pd.read_csv(self.participants_file)
-            with open(self.progress_file, 'r') as f:
-                progress = json.load(f)
-
-            # Find the player
-            player_row = participants_df[participants_df['Name'] == player_name]
-            if player_row.empty:
-                return None
-
-            player_row = player_row.iloc[0]
-            current_numbers = set(progress['players'].get(player_name, {}).get('correct_numbers', []))
-            chosen_numbers = set(int(player_row[f'Number{i}']) for i in range(1, 11))
-            missing_numbers = chosen_numbers - current_numbers
-
-            # Count potential winners
-            potential_winners = 0
-            for _, participant in participants_df.iterrows():
-                participant_name = participant['Name']
-                if participant_name == player_name:
-                    continue
-
-                participant_correct = set(progress['players'].get(participant_name, {}).get('correct_numbers', []))
-                participant_total = len(participant_correct)
-                participant_numbers = set(int(participant[f'Number{i}']) for i in range(1, 11))
-                matching_numbers = missing_numbers.intersection(participant_numbers)
-
-                if participant_total + len(matching_numbers) >= 10:
-                    potential_winners += 1
-
-            return sorted(list(missing_numbers)), potential_winners
-
-        except Exception as e:
-            print(f"Error analyzing missing numbers: {e}")
-            return None
-
     def analyze_future_winners(self, family_name):
         """Analyze future winners for a specific family"""
-        if not os.path.exists(self.participants_file) or not os.path.exists(self.progress_file):
+        if not os.path.exists(self.participants_file):
             print("Missing required data files. Please ensure lottery data exists.")
             return
 
-        participants_df = pd.read_csv(self.participants_file)
-        with open(self.progress_file, 'r') as f:
-            progress = json.load(f)
+        progress = self.progress
 
-        family_members = participants_df[participants_df['Name'].str.startswith(family_name)]
-        
-        if family_members.empty:
+        names, all_numbers, masks = load_participants(self.participants_file)
+        correct_masks = {
+            name: player_correct_mask(player)
+            for name, player in progress['players'].items()
+        }
+        all_totals = np.array([correct_masks.get(name, 0).bit_count() for name in names])
+        family_indices = [i for i, name in enumerate(names) if name.startswith(family_name)]
+
+        if not family_indices:
             print(f"No family members found starting with '{family_name}'")
             return
 
         print(f"\nFuture Winners Analysis for {family_name} Family")
         print("=" * 70)
 
-        for _, family_member in family_members.iterrows():
-            name = family_member['Name']
-            current_numbers = set(progress['players'].get(name, {}).get('correct_numbers', []))
-            chosen_numbers = set(family_member[f'Number{i}'] for i in range(1, 11))
-            missing_numbers = chosen_numbers - current_numbers
-
-            potential_winners = set()
-
-            for _, participant in participants_df.iterrows():
-                participant_name = participant['Name']
-                if participant_name == name:
-                    continue
-
-                participant_correct = set(progress['players'].get(participant_name, {}).get('correct_numbers', []))
-                participant_total = len(participant_correct)
-                participant_numbers = set(participant[f'Number{i}'] for i in range(1, 11))
-                matching_numbers = missing_numbers.intersection(participant_numbers)
-
-                if participant_total + len(matching_numbers) >= 10:
-                    potential_winners.add(participant_name)
+        # One (F, N) popcount broadcast covers every family member against
+        # every participant in a single C-level pass.
+        family_arr = np.array(family_indices)
+        current = np.array([correct_masks.get(name, 0) for name in names[family_arr]],
+                           dtype=np.uint64)
+        missing = masks[family_arr] & ~current
+        would_win = all_totals[None, :] + np.bitwise_count(
+            missing[:, None] & masks[None, :]) >= 10
+
+        for k, i in enumerate(family_indices):
+            name = names[i]
+            missing_mask = int(missing[k])
+            potential_winners = set(
+                names[j] for j in np.flatnonzero(would_win[k]) if names[j] != name)
 
             print(f"\n{name}")
-            print(f"Current correct numbers: {len(current_numbers)}")
-            print(f"Missing numbers: {sorted(list(missing_numbers))}")
+            print(f"Current correct numbers: {correct_masks.get(name, 0).bit_count()}")
+            print(f"Missing numbers: {mask_to_numbers(missing_mask)}")
             print("-" * 70)
 
             if potential_winners:
@@ -431,11 +576,10 @@ class LotteryManager:
 
     def show_current_standings(self):
         """Show current standings from latest draw"""
-        trekking = self.read_trekking()
-        if not trekking.empty:
-            latest = trekking.iloc[-1]
-            numbers = sorted([latest[f'number{i}'] for i in range(1, 7)])
-            self.check_participants(numbers, latest['date'], True)
+        latest = self._last_trekking_row()
+        if latest:
+            numbers = sorted(int(n) for n in latest[1:7])
+            self.check_participants(numbers, latest[0], True)
         else:
             print("No draws found. Please add a draw first.")
 
@@ -462,15 +606,10 @@ class LotteryManager:
         draw_date = self.get_draw_date()
         self.add_to_trekking(numbers, draw_date)
         self.check_participants(numbers, draw_date, True)
+        self.flush()
 
 
 def main():
-    try:
-        from termcolor import colored
-    except ImportError:
-        print("Please install termcolor: pip install termcolor")
-        sys.exit(1)
-
     parser = argparse.ArgumentParser(
         description='Unified Lottery Management System',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -485,7 +624,8 @@ Examples:
     args = parser.parse_args()
     
     manager = LotteryManager()
-    
+    atexit.register(manager.flush)
+
     if args.pdf_file:
         # Start new lottery from PDF
         if manager.start_new_lottery(args.pdf_file):